@@ -26,6 +26,29 @@ GetOption = Literal[
 ]
 
 
+class _URLParams(dict):
+    """URL template parameters which keep unknown placeholders untouched"""
+
+    def __missing__(self, key: str) -> str:
+        return f"{{{key}}}"
+
+
+def format_url(template: str, **params: str) -> str:
+    """Fill in URL template placeholders in one pass
+
+    Placeholders without a given value are kept as they are, so they can be filled later.
+
+    Args:
+        template: URL template (e.g. ``/pm/config/{scope}/obj/firewall/address``)
+        **params: placeholder values
+
+    Examples:
+        >>> format_url("/dvmdb/{scope}/device/{device}/vdom", scope="adom/root")
+        '/dvmdb/adom/root/device/{device}/vdom'
+    """
+    return template.format_map(_URLParams(params))
+
+
 class FMGBaseObject(BaseModel, ABC):
     """Abstract base object for all high-level objects
 
@@ -67,8 +90,7 @@ class FMGBaseObject(BaseModel, ABC):
             if "{scope}" in self._url:
                 raise FMGMissingScopeException(f"Missing scope for {self}")
             return self._url
-        url = self._url.replace("{scope}", self.fmg_scope)
-        return url
+        return format_url(self._url, scope=self.fmg_scope)
 
     @property
     def fmg_scope(self) -> str:
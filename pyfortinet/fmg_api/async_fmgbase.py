@@ -7,13 +7,20 @@ import re
 import time
 from copy import copy
 from random import randint
-from typing import Any, Callable, Optional, Union, List, Coroutine
+from typing import Any, Callable, Dict, Optional, Union, List, Coroutine
 from dataclasses import dataclass, field
 
 try:
     import aiohttp
 except ModuleNotFoundError:
     """async install option"""
+try:
+    from orjson import dumps as json_dumps
+    from orjson import loads as json_loads
+except ModuleNotFoundError:
+    """faster JSON handling is an install option"""
+    from json import dumps as json_dumps
+    from json import loads as json_loads
 
 from pydantic import SecretStr
 
@@ -30,11 +37,16 @@ from pyfortinet.exceptions import (
 )
 from pyfortinet.fmg_api import FMGObject
 from pyfortinet.fmg_api.common import F
-from pyfortinet.fmg_api.task import Task
+from pyfortinet.fmg_api.task import TASK_FINAL_STATES, Task
 from pyfortinet.settings import FMGSettings
 
 logger = logging.getLogger(__name__)
 
+# body is serialized by json_dumps, so content type is set explicitly
+_JSON_HEADERS = {"Content-Type": "application/json"}
+# task polling starts with this interval and backs off exponentially up to loop_interval
+_FIRST_POLL_INTERVAL = 0.1
+
 
 def auth_required(func: Callable) -> Callable:
     """Decorator to provide authentication for the method
@@ -124,14 +136,14 @@ class AsyncFMGResponse:
 
     def first(self) -> Optional[Union[FMGObject, dict]]:
         """Return first data or None if result is empty"""
+        # data may be replaced after the response is created, so the result is not cached
         if isinstance(self.data, dict):
-            if isinstance(self.data.get("data"), list):
-                return self.data.get("data")[0] if self.data.get("data") else None
-            else:
-                return self.data.get("data")
-        elif isinstance(self.data, list) and self.data:  # non-empty list
-            return self.data[0]
-        return None
+            data = self.data.get("data")
+            if not isinstance(data, list):
+                return data
+        else:
+            data = self.data
+        return data[0] if isinstance(data, list) and data else None
 
     async def wait_for_task(
         self, callback: Callable[[int, str], Union[None | Coroutine]] = None, timeout: int = 60, loop_interval: int = 2
@@ -362,9 +374,14 @@ class AsyncFMGBase:
             except FMGException:  # go ahead and ensure logout regardless we could unlock
                 pass
             req = await self._session.post(
-                str(self._settings.base_url), json=request, ssl=self._settings.verify, timeout=self._settings.timeout
+                str(self._settings.base_url),
+                data=json_dumps(request),
+                headers=_JSON_HEADERS,
+                ssl=self._settings.verify,
+                timeout=self._settings.timeout,
             )
-            status = (await req.json()).get("result", [{}])[0].get("status", {})
+            reply = await req.json(loads=json_loads)
+            status = reply.get("result", [{}])[0].get("status", {})
             if status.get("code") != 0:
                 logger.warning("Logout failed!")
         except aiohttp.ClientConnectorError:
@@ -387,9 +404,13 @@ class AsyncFMGBase:
     async def _post(self, request: dict) -> Any:
         logger.debug("posting data: %s", request)
         req = await self._session.post(
-            str(self._settings.base_url), json=request, ssl=self._settings.verify, timeout=self._settings.timeout
+            str(self._settings.base_url),
+            data=json_dumps(request),
+            headers=_JSON_HEADERS,
+            ssl=self._settings.verify,
+            timeout=self._settings.timeout,
         )
-        results = (await req.json()).get("result", [])
+        results = (await req.json(loads=json_loads)).get("result", [])
         for result in results:
             status = result["status"]
             if status["code"] == 0:
@@ -427,8 +448,15 @@ class AsyncFMGBase:
             ],
         }
         try:
-            req = await self._session.post(str(self._settings.base_url), json=request, ssl=self._settings.verify)
-            status = (await req.json()).get("result", [{}])[0].get("status", {})
+            req = await self._session.post(
+                str(self._settings.base_url),
+                data=json_dumps(request),
+                headers=_JSON_HEADERS,
+                ssl=self._settings.verify,
+                timeout=self._settings.timeout,
+            )
+            reply = await req.json(loads=json_loads)
+            status = reply.get("result", [{}])[0].get("status", {})
             if status.get("code") != 0:
                 if "No permission for resource" in status.get("message"):
                     raise FMGUnhandledException("No permission for resource, probably user does not have API access!")
@@ -440,7 +468,7 @@ class AsyncFMGBase:
         except aiohttp.ClientConnectorError as err:
             logger.error("Can't gather token: %s", err)
             raise err
-        token = (await req.json()).get("session", "")
+        token = reply.get("session", "")
         return SecretStr(token)
 
     @auth_required
@@ -763,7 +791,8 @@ class AsyncFMGBase:
             callback: (Callable[[int, str], None]): function to call in each iteration.
                                               It must accept 2 args which are the current percentage and latest log line
             timeout: (int): timeout for waiting in seconds
-            loop_interval: (int): interval between task status updates in seconds
+            loop_interval: (int): maximum interval between task status updates in seconds, polling starts more
+                                  frequently and backs off to it
 
         Example:
             ```pycon
@@ -785,22 +814,84 @@ class AsyncFMGBase:
             >>> asyncio.run(add_device(test_device))
             ```
         """
-        task_id = task_res if isinstance(task_res, int) else task_res.data.get("data", {}).get("taskid")
+        task_id = self._get_task_id(task_res)
         if task_id is None:
             return
         start_time = time.time()
+        interval = min(_FIRST_POLL_INTERVAL, loop_interval)
         while True:
             task: Task = (await self.get(Task, F(id=task_id))).first()
             if not task:
                 return
-            if time.time() - start_time > timeout:
-                raise TimeoutError(f"Timed out waiting {timeout} seconds for the task {task.id}!")
             if callable(callback):
                 if asyncio.iscoroutinefunction(callback):
                     await callback(task.percent, task.line[-1].detail if task.line else "")
                 else:
                     callback(task.percent, task.line[-1].detail if task.line else "")
             # exit on the following states
-            if task.state in ["cancelled", "done", "error", "aborted", "to_continue", "unknown"]:
+            if task.state in TASK_FINAL_STATES:
                 return task.state
-            await asyncio.sleep(loop_interval)
+            if time.time() - start_time > timeout:
+                raise TimeoutError(f"Timed out waiting {timeout} seconds for the task {task.id}!")
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, loop_interval)
+
+    async def wait_for_tasks(
+        self,
+        *task_res: Union[int, AsyncFMGResponse],
+        callback: Callable[[int, int, str], Union[None | Coroutine]] = None,
+        timeout: int = 60,
+        loop_interval: int = 2,
+    ) -> Dict[int, Optional[str]]:
+        """Wait for multiple tasks to finish
+
+        All unfinished tasks are polled by a single request in each iteration. Use this instead of gathering
+        ``wait_for_task`` calls which would poll each task separately.
+
+        Args:
+            *task_res: (int, AsyncFMGResponse): Tasks or task IDs to check
+            callback: (Callable[[int, int, str], None]): function to call for each task in each iteration.
+                                              It must accept 3 args which are the task ID, the current percentage and
+                                              latest log line
+            timeout: (int): timeout for waiting in seconds
+            loop_interval: (int): maximum interval between task status updates in seconds, polling starts more
+                                  frequently and backs off to it
+
+        Returns:
+            (dict[int, Optional[str]]): final state of the tasks by task ID, tasks which are not found have None
+                                        state. Failed polls are retried until the timeout.
+        """
+        pending = [task_id for task_id in map(self._get_task_id, task_res) if task_id is not None]
+        states = {}
+        start_time = time.time()
+        interval = min(_FIRST_POLL_INTERVAL, loop_interval)
+        while pending:
+            response = await self.get(Task, F(id__in=pending))
+            # failed poll is retried until the timeout, only tasks missing from the reply are dropped
+            if response.success:
+                for task in response.data:
+                    if callable(callback):
+                        if asyncio.iscoroutinefunction(callback):
+                            await callback(task.id, task.percent, task.line[-1].detail if task.line else "")
+                        else:
+                            callback(task.id, task.percent, task.line[-1].detail if task.line else "")
+                    if task.state in TASK_FINAL_STATES:
+                        states[task.id] = task.state
+                # tasks which are not found or finished are not polled anymore
+                found = {task.id for task in response.data}
+                states.update({task_id: None for task_id in pending if task_id not in found})
+                pending = [task_id for task_id in pending if task_id not in states]
+            if not pending:
+                break
+            if time.time() - start_time > timeout:
+                raise TimeoutError(f"Timed out waiting {timeout} seconds for the tasks {pending}!")
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, loop_interval)
+        return states
+
+    @staticmethod
+    def _get_task_id(task_res: Union[int, AsyncFMGResponse]) -> Optional[int]:
+        """Get task ID from response"""
+        if isinstance(task_res, int):
+            return task_res
+        return task_res.data.get("data", {}).get("taskid") or task_res.data.get("data", {}).get("task")
@@ -1,11 +1,46 @@
 """Common objects"""
 
 import re
-from typing import Literal, List, Union, Optional
+from functools import cache
+from typing import Any, Literal, List, Union, Optional
 
+from pydantic import AliasChoices, Field
 from pydantic.dataclasses import dataclass
 
 
+@cache
+def _alias_choices(name: str, sep: str) -> AliasChoices:
+    """Return the shared AliasChoices instance for an API attribute name"""
+    return AliasChoices(name.replace("_", sep), name)
+
+
+def alias_field(name: str, default: Any = None, sep: str = "-", **kwargs) -> Any:
+    """Field for an attribute which has a different name in the API
+
+    FMG uses dash (or space) separated attribute names which are not valid python identifiers. The returned field
+    accepts both forms on input and serializes to the API form. ``AliasChoices`` objects are cached, so every field
+    with the same name reuses the same instance.
+
+    Examples:
+        >>> from pydantic import BaseModel
+        >>> class Obj(BaseModel):
+        ...     allow_routing: Optional[str] = alias_field("allow_routing")
+        >>> Obj(**{"allow-routing": "enable"}).model_dump(by_alias=True)
+        {'allow-routing': 'enable'}
+
+    Args:
+        name: python attribute name
+        default: default value of the field
+        sep: separator used by the API instead of underscore
+
+    Keyword Args:
+        kwargs: any other argument for ``pydantic.Field``
+    """
+    return Field(
+        default, validation_alias=_alias_choices(name, sep), serialization_alias=name.replace("_", sep), **kwargs
+    )
+
+
 @dataclass
 class Scope:
     """Specify scope for an object
@@ -58,6 +93,13 @@ OP = {
     "not_glob": "!glob",
 }
 
+# tokens of text_to_filter: "[~]fname fop fvalue" and the operators between them
+_F_TOKEN_RE = re.compile(
+    rf'(?P<negate>~)?\s*(?P<fname>\w+)\s+(?P<fop>{"|".join(OP.keys())})\s+(?P<fvalue>\S+)(?<![,|&])'
+)
+_OP_TOKEN_RE = re.compile(r"(?P<op>and|or|,)\s+")
+_TEXT_OPS = {"and": "&&", "or": "||", ",": ","}
+
 
 class F:
     """Filter class that allows us to define a single filter for an object
@@ -229,9 +271,7 @@ def text_to_filter(text: str) -> FILTER_TYPE:
     text = text.strip()
     while text:
         # search F tokens
-        f_match = re.match(
-            rf'(?P<negate>~)?\s*(?P<fname>\w+)\s+(?P<fop>{"|".join(OP.keys())})\s+(?P<fvalue>\S+)(?<![,|&])', text
-        )
+        f_match = _F_TOKEN_RE.match(text)
         if f_match:
             kwargs = {f"{f_match.group('fname')}__{f_match.group('fop')}": f_match.group("fvalue")}
             if f_match.group("negate"):
@@ -244,9 +284,9 @@ def text_to_filter(text: str) -> FILTER_TYPE:
         if not text:
             return f_token
         # search list or complex filter ops
-        op_match = re.match(rf"(?P<op>and|or|,)\s+", text)
+        op_match = _OP_TOKEN_RE.match(text)
         if op_match:
-            op = {"and": "&&", "or": "||", ",": ","}.get(op_match.group("op"))
+            op = _TEXT_OPS[op_match.group("op")]
         else:
             raise ValueError(f"Couldn't parse '{text}'!")
         text = text[op_match.end() :].strip()
@@ -2,10 +2,10 @@
 
 from typing import Literal, Optional, List, Dict, Union
 
-from pydantic import Field, field_validator, AliasChoices, BaseModel, IPvAnyAddress
+from pydantic import Field, field_validator, BaseModel, IPvAnyAddress
 
 from pyfortinet.fmg_api import FMGObject
-from pyfortinet.fmg_api.common import Scope
+from pyfortinet.fmg_api.common import Scope, alias_field
 
 CONF_STATUS = Literal["unknown", "insync", "outofsync"]
 CONN_MODE = Literal["active", "passive"]
@@ -72,9 +72,7 @@ class BaseDevice(BaseModel):
     adm_pass: Union[None, str, list[str]] = Field(None, max_length=128)
     desc: Optional[str] = None
     ip: Optional[str] = None
-    meta_fields: Optional[dict[str, str]] = Field(
-        None, validation_alias=AliasChoices("meta fields", "meta_fields"), serialization_alias="meta fields"
-    )
+    meta_fields: Optional[dict[str, str]] = alias_field("meta_fields", sep=" ")
     mgmt_mode: Optional[MGMT_MODE] = None
     os_type: Optional[OS_TYPE] = None
     os_ver: Optional[OS_VER] = Field(None, description="Major release no")
@@ -82,12 +80,7 @@ class BaseDevice(BaseModel):
     patch: Optional[int] = Field(None, description="Patch release no")
     sn: Optional[str] = Field(None, description="Serial number")
     # extra attributes which are sent by FMG when asked for extra
-    assignment_info: Optional[List[Dict[str, str]]] = Field(
-        None,
-        validation_alias=AliasChoices("assignment info", "assignment_info"),
-        serialization_alias="assignment info",
-        exclude=True,
-    )
+    assignment_info: Optional[List[Dict[str, str]]] = alias_field("assignment_info", sep=" ", exclude=True)
 
     @field_validator("ip")
     def validate_ip(cls, v):
@@ -132,17 +125,10 @@ class RealDevice(FMGObject, BaseDevice):
         device_blueprint (str): Device blueprint name
     """
 
-    device_action: Optional[DEVICE_ACTION] = Field(
-        "",
-        description="Leave empty for real device!",
-        validation_alias=AliasChoices("device action", "device_action"),
-        serialization_alias="device action",
-    )
-    device_blueprint: Optional[str] = Field(
-        None,
-        validation_alias=AliasChoices("device blueprint", "device_blueprint"),
-        serialization_alias="device blueprint",
+    device_action: Optional[DEVICE_ACTION] = alias_field(
+        "device_action", "", sep=" ", description="Leave empty for real device!"
     )
+    device_blueprint: Optional[str] = alias_field("device_blueprint", sep=" ")
     adm_usr: str = Field("admin", pattern=r"[\w-]{1,36}")
     adm_pass: str = Field(..., max_length=128)
     ip: str
@@ -169,16 +155,8 @@ class ModelDevice(FMGObject, BaseDevice):
         platform_str (str): Platform string for virtual device
     """
 
-    device_action: DEVICE_ACTION = Field(
-        "add_model",
-        validation_alias=AliasChoices("device action", "device_action"),
-        serialization_alias="device action",
-    )
-    device_blueprint: Optional[str] = Field(
-        None,
-        validation_alias=AliasChoices("device blueprint", "device_blueprint"),
-        serialization_alias="device blueprint",
-    )
+    device_action: DEVICE_ACTION = alias_field("device_action", "add_model", sep=" ")
+    device_blueprint: Optional[str] = alias_field("device_blueprint", sep=" ")
     platform_str: Optional[str] = None
     # make os_ver and mr mandatory
     os_ver: OS_VER
@@ -197,19 +175,12 @@ class VDOM(FMGObject):
     # API attributes
     name: Optional[str]
     comments: Optional[str]
-    meta_fields: Optional[dict[str, str]] = Field(
-        None, validation_alias=AliasChoices("meta fields", "meta_fields"), serialization_alias="meta fields"
-    )
+    meta_fields: Optional[dict[str, str]] = alias_field("meta_fields", sep=" ")
     opmode: Optional[OP_MODE]
     status: Optional[str]
     vdom_type: Optional[VDOM_TYPE]
     # extra attributes
-    assignment_info: Optional[List[Dict[str, str]]] = Field(
-        None,
-        validation_alias=AliasChoices("assignment info", "assignment_info"),
-        serialization_alias="assignment info",
-        exclude=True,
-    )
+    assignment_info: Optional[List[Dict[str, str]]] = alias_field("assignment_info", sep=" ", exclude=True)
 
     @field_validator("opmode", mode="before")
     def validate_opmode(cls, v) -> OP_MODE:
@@ -8,7 +8,7 @@ from more_itertools import first
 from pydantic import Field, field_validator, AliasChoices, BaseModel
 
 from pyfortinet.fmg_api import FMGObject
-from pyfortinet.fmg_api.common import Scope
+from pyfortinet.fmg_api.common import Scope, alias_field
 
 ADDRESS_GROUP_TYPE = Literal["default", "array", "folder"]
 ADDRESS_GROUP_CATEGORY = Literal["default", "ztna-ems-tag", "ztna-geo-tag"]
@@ -94,12 +94,8 @@ class Address(FMGObject):
 
     class AddressList(BaseModel):
         ip: Optional[str] = None
-        net_id: Optional[str] = Field(
-            None, validation_alias=AliasChoices("net-id", "net_id"), serialization_alias="net-id"
-        )
-        obj_id: Optional[str] = Field(
-            None, validation_alias=AliasChoices("obj-id", "obj_id"), serialization_alias="obj-id"
-        )
+        net_id: Optional[str] = alias_field("net_id")
+        obj_id: Optional[str] = alias_field("obj_id")
 
     class AddressTagging(BaseModel):
         category: Optional[str] = None
@@ -108,91 +104,47 @@ class Address(FMGObject):
 
     _url: str = "/pm/config/{scope}/obj/firewall/address"
     name: Optional[str] = Field(None, max_length=128)
-    allow_routing: Optional[ALLOW_ROUTING] = Field(
-        None, validation_alias=AliasChoices("allow-routing", "allow_routing"), serialization_alias="allow-routing"
-    )
-    associated_interface: Optional[Union[str, list[str]]] = Field(
-        None,
-        validation_alias=AliasChoices("associated-interface", "associated_interface"),
-        serialization_alias="associated-interface",
-    )
-    cache_ttl: Optional[int] = Field(
-        None, validation_alias=AliasChoices("cache-ttl", "cache_ttl"), serialization_alias="cache-ttl"
-    )
-    clearpass_spt: Optional[CLEARPASS_SPT] = Field(
-        None, validation_alias=AliasChoices("clearpass-spt", "clearpass_spt"), serialization_alias="clearpass-spt"
-    )
+    allow_routing: Optional[ALLOW_ROUTING] = alias_field("allow_routing")
+    associated_interface: Optional[Union[str, list[str]]] = alias_field("associated_interface")
+    cache_ttl: Optional[int] = alias_field("cache_ttl")
+    clearpass_spt: Optional[CLEARPASS_SPT] = alias_field("clearpass_spt")
     color: Optional[int] = None
     comment: Optional[str] = None
     country: Optional[str] = None
     dirty: Optional[DIRTY] = None
     dynamic_mapping: Optional[Union[List["Address"], "Address"]] = None
     end_ip: Optional[str] = None
-    epg_name: Optional[str] = Field(
-        None, validation_alias=AliasChoices("epg-name", "epg_name"), serialization_alias="epg-name"
-    )
-    fabric_object: Optional[FABRIC_OBJECT] = Field(
-        None, validation_alias=AliasChoices("fabric-object", "fabric_object"), serialization_alias="fabric-object"
-    )
+    epg_name: Optional[str] = alias_field("epg_name")
+    fabric_object: Optional[FABRIC_OBJECT] = alias_field("fabric_object")
     filter: Optional[str] = None
     fqdn: Optional[str] = None
-    fsso_group: Optional[List[str]] = Field(
-        None, validation_alias=AliasChoices("fsso-group", "fsso_group"), serialization_alias="fsso-group"
-    )
+    fsso_group: Optional[List[str]] = alias_field("fsso_group")
     interface: Optional[str] = None
     list: Optional[List["AddressList"]] = None
     macaddr: Optional[List[str]] = None
-    node_ip_only: Optional[NODE_IP_ONLY] = Field(
-        None, validation_alias=AliasChoices("node-ip-only", "node_ip_only"), serialization_alias="node-ip-only"
-    )
-    obj_id: Optional[str] = Field(None, validation_alias=AliasChoices("obj-id", "obj_id"), serialization_alias="obj-id")
-    obj_tag: Optional[str] = Field(
-        None, validation_alias=AliasChoices("obj-tag", "obj_tag"), serialization_alias="obj-tag"
-    )
-    obj_type: Optional[OBJ_TYPE] = Field(
-        None, validation_alias=AliasChoices("obj-type", "obj_type"), serialization_alias="obj-type"
-    )
+    node_ip_only: Optional[NODE_IP_ONLY] = alias_field("node_ip_only")
+    obj_id: Optional[str] = alias_field("obj_id")
+    obj_tag: Optional[str] = alias_field("obj_tag")
+    obj_type: Optional[OBJ_TYPE] = alias_field("obj_type")
     organization: Optional[str] = None
-    policy_group: Optional[str] = Field(
-        None, validation_alias=AliasChoices("policy-group", "policy_group"), serialization_alias="policy-group"
-    )
+    policy_group: Optional[str] = alias_field("policy_group")
     sdn: Optional[str] = None
-    sdn_addr_type: Optional[SDN_ADDR_TYPE] = Field(
-        None, validation_alias=AliasChoices("sdn-addr-type", "sdn_addr_type"), serialization_alias="sdn-addr-type"
-    )
-    sdn_tag: Optional[str] = Field(
-        None, validation_alias=AliasChoices("sdn-tag", "sdn_tag"), serialization_alias="sdn-tag"
-    )
-    start_ip: Optional[str] = Field(
-        None, validation_alias=AliasChoices("start-ip", "start_ip"), serialization_alias="start-ip"
-    )
-    sub_type: Optional[SUB_TYPE] = Field(
-        None, validation_alias=AliasChoices("sub-type", "sub_type"), serialization_alias="sub-type"
-    )
+    sdn_addr_type: Optional[SDN_ADDR_TYPE] = alias_field("sdn_addr_type")
+    sdn_tag: Optional[str] = alias_field("sdn_tag")
+    start_ip: Optional[str] = alias_field("start_ip")
+    sub_type: Optional[SUB_TYPE] = alias_field("sub_type")
     subnet: Optional[Union[str, List[str]]] = None
-    subnet_name: Optional[str] = Field(
-        None, validation_alias=AliasChoices("subnet-name", "subnet_name"), serialization_alias="subnet-name"
-    )
-    tag_detection_level: Optional[str] = Field(
-        None,
-        validation_alias=AliasChoices("tag-detection-level", "tag_detection_level"),
-        serialization_alias="tag-detection-level",
-    )
-    tag_type: Optional[str] = Field(
-        None, validation_alias=AliasChoices("tag-type", "tag_type"), serialization_alias="tag-type"
-    )
+    subnet_name: Optional[str] = alias_field("subnet_name")
+    tag_detection_level: Optional[str] = alias_field("tag_detection_level")
+    tag_type: Optional[str] = alias_field("tag_type")
     tagging: Optional[List[AddressTagging]] = None
     tenant: Optional[str] = None
     type: Optional[ADDRESS_TYPE] = None
     uuid: Optional[str] = None
     wildcard: Optional[str] = None
-    wildcard_fqdn: Optional[str] = Field(
-        None, validation_alias=AliasChoices("wildcard-fqdn", "wildcard_fqdn"), serialization_alias="wildcard-fqdn"
-    )
+    wildcard_fqdn: Optional[str] = alias_field("wildcard_fqdn")
     # Mapping fields
-    global_object: Optional[int] = Field(
-        None, validation_alias=AliasChoices("global-object", "global_object"), serialization_alias="global-object"
-    )
+    global_object: Optional[int] = alias_field("global_object")
     mapping__scope: Optional[Union[Union[dict, Scope], List[Union[dict, Scope]]]] = Field(
         None, validation_alias=AliasChoices("_scope", "mapping__scope"), serialization_alias="_scope"
     )
@@ -278,9 +230,7 @@ class AddressGroup(FMGObject):
     _url: str = "/pm/config/{scope}/obj/firewall/addrgrp"
     name: str
     member: list[Address]
-    exclude_member: list[Address] = Field(
-        ..., validation_alias=AliasChoices("exclude-member", "exclude_member"), serialization_alias="exclude-member"
-    )
+    exclude_member: list[Address] = alias_field("exclude_member", ...)
     comment: str = ""
     category: ADDRESS_GROUP_CATEGORY = "default"
     type: ADDRESS_GROUP_TYPE = "default"
@@ -2,18 +2,23 @@
 
 import logging
 from inspect import isclass
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Optional, Union, Any, Type, List, Dict
 
 from more_itertools import first
 
 from pyfortinet.exceptions import FMGException, FMGWrongRequestException
-from pyfortinet.fmg_api import FMGObject, FMGExecObject, AnyFMGObject, GetOption
+from pyfortinet.fmg_api import format_url, FMGObject, FMGExecObject, AnyFMGObject, GetOption
 from pyfortinet.fmg_api.fmgbase import FMGBase, FMGResponse, auth_required
 from pyfortinet.settings import FMGSettings
 from pyfortinet.fmg_api.common import FILTER_TYPE
 
 logger = logging.getLogger(__name__)
 
+# request template of get_adom_list
+_ADOM_LIST_REQ = MappingProxyType({"url": "/dvmdb/adom", "fields": ("name",)})
+
 
 class FMG(FMGBase):
     """FMG API for humans
@@ -114,11 +119,8 @@ class FMG(FMGBase):
                 scope = "global" if self._settings.adom == "global" else f"adom/{self._settings.adom}"
             else:  # user specified
                 scope = "global" if scope == "global" else f"adom/{scope}"
-            url = request._url.default.replace("{scope}", scope)
-            if self._settings.adom != "global":
-                url = url.replace("{adom}", f"/adom/{self._settings.adom}")
-            else:
-                url = url.replace("{adom}", "")
+            adom = f"/adom/{self._settings.adom}" if self._settings.adom != "global" else ""
+            url = format_url(request._url.default, scope=scope, adom=adom)
 
             api_request = {
                 "loadsub": 1 if loadsub else 0,
@@ -430,11 +432,11 @@ class FMG(FMGBase):
         Returns:
             list of adom strings or None in case of error
         """
-        request = {"url": "/dvmdb/adom", "fields": ["name"]}
+        request = dict(_ADOM_LIST_REQ)
         if filters:
             request["filter"] = self._get_filter_list(filters)
 
         response: FMGResponse = self.get(request)
         if response.success:
-            return [adom.get("name") for adom in response.data.get("data")]
+            return list(map(itemgetter("name"), response.data.get("data", ())))
         return None
@@ -2,7 +2,7 @@
 
 from typing import Literal, Optional, Union, List
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import ConfigDict, Field, field_validator, model_validator
 
 from pyfortinet.fmg_api import FMGExecObject, FMGObject
 
@@ -10,6 +10,8 @@ from pyfortinet.fmg_api import FMGExecObject, FMGObject
 class TaskLineHistory(FMGObject):
     """Task line history"""
 
+    model_config = ConfigDict(defer_build=True)
+
     detail: str
     name: str
     percent: int
@@ -56,10 +58,19 @@ TASK_STATE = Literal[
     "unknown",
 ]
 
+# value lists to convert numeric API values to their text form
+_TASK_SRC_VALUES = TASK_SRC.__args__
+_TASK_STATE_VALUES = TASK_STATE.__args__
+
+# task is not running anymore in these states
+TASK_FINAL_STATES = ("cancelled", "done", "error", "aborted", "to_continue", "unknown")
+
 
 class TaskLine(FMGObject):
     """Task line object"""
 
+    model_config = ConfigDict(defer_build=True)
+
     detail: Optional[str] = None
     end_tm: Optional[int] = 0
     err: Optional[int] = 0
@@ -74,12 +85,13 @@ class TaskLine(FMGObject):
 
     @field_validator("state", mode="before")
     def validate_src(cls, v: int) -> TASK_STATE:
-        return TASK_STATE.__dict__.get("__args__")[v] if isinstance(v, int) else v
+        return _TASK_STATE_VALUES[v] if isinstance(v, int) else v
 
 
 class Task(FMGObject):
     """Task class"""
 
+    model_config = ConfigDict(defer_build=True)  # schema is built on first use (e.g. at wait_for_task)
     _url = "/task/task"
 
     adom: Optional[int]
@@ -102,8 +114,8 @@ class Task(FMGObject):
 
     @field_validator("src", mode="before")
     def validate_src(cls, v: int) -> TASK_SRC:
-        return TASK_SRC.__dict__.get("__args__")[v] if isinstance(v, int) else v
+        return _TASK_SRC_VALUES[v] if isinstance(v, int) else v
 
     @field_validator("state", mode="before")
     def validate_state(cls, v: int) -> TASK_STATE:
-        return TASK_STATE.__dict__.get("__args__")[v] if isinstance(v, int) else v
+        return _TASK_STATE_VALUES[v] if isinstance(v, int) else v
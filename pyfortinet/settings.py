@@ -4,7 +4,15 @@ from typing import Annotated
 
 from pydantic import Field, SecretStr, field_validator
 from pydantic.networks import HttpUrl
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+def _normalize_base_url(url: str) -> str:
+    """Strip trailing slashes/spaces and ensure the URL ends with /jsonrpc"""
+    url = url.rstrip("/ ")
+    if not url.endswith("/jsonrpc"):
+        url += "/jsonrpc"
+    return url
 
 
 class FMGSettings(BaseSettings):
@@ -20,6 +28,8 @@ class FMGSettings(BaseSettings):
         raise_on_error (bool): Raise exception on error
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     base_url: Annotated[HttpUrl, Field(description="Base URL to access FMG (e.g.: https://myfmg/jsonrpc)")]
     username: Annotated[str, Field(description="User to authenticate")]
     password: Annotated[SecretStr, Field(description="Password for authentication")]
@@ -37,9 +47,6 @@ class FMGSettings(BaseSettings):
     )
 
     @field_validator("base_url", mode="before")
-    def check_base_url(cls, v: str):
+    def check_base_url(cls, v: str) -> str:
         """check and fix base_url"""
-        v = v.rstrip("/ ")
-        if not v.endswith("/jsonrpc"):
-            v += "/jsonrpc"
-        return HttpUrl(v)
+        return _normalize_base_url(str(v))
@@ -1,23 +1,30 @@
 """Invoke task file"""
 
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Literal
 
 from invoke import task
 
 
+def _remove(item: Path):
+    """Remove file or directory"""
+    if item.is_dir():
+        shutil.rmtree(item)
+    elif item.is_file():
+        item.unlink()
+    print(f"{item} deleted")
+
+
 @task()
 def clean_dist(cmd):  # pylint: disable=unused-argument  # mandatory argument
     """Clean dist directory"""
     directory = Path("dist")
     if directory.is_dir():
-        for item in directory.glob("*"):
-            if item.is_dir():
-                shutil.rmtree(item)
-            elif item.is_file():
-                item.unlink()
-            print(f"{item} deleted")
+        items = list(directory.glob("*"))
+        with ThreadPoolExecutor(max_workers=min(32, len(items) or 1)) as executor:
+            list(executor.map(_remove, items))
 
 
 @task(clean_dist)
@@ -49,6 +56,16 @@ def mkdocs_serve(cmd):
     cmd.run("mkdocs serve")
 
 
+@task(
+    help={
+        "lab": "Run the lab tests as well, they need the FMG configured in lab-config.yml",
+    }
+)
+def test(cmd, lab=False):
+    """Run tests"""
+    cmd.run("pytest" if lab else 'pytest -m "not lab"')
+
+
 LinterType = Literal[
     "all",
     "trailing-whitespace",
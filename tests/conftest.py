@@ -1,7 +1,15 @@
 """Pytest setup"""
 
 import asyncio
+import json
+import os
+import re
+from collections import namedtuple
+from functools import wraps
+from json import loads as json_loads
 from pathlib import Path
+from typing import Callable
+from unittest.mock import patch
 
 import pytest
 import requests
@@ -9,11 +17,13 @@ from ruamel.yaml import YAML
 
 from pyfortinet import FMG, FMGSettings, FMGBase, AsyncFMGBase, AsyncFMG
 from pyfortinet.exceptions import FMGConfigurationException
+from pyfortinet.fmg_api.dvmdb import Device
 
 
 def pytest_addoption(parser):
     """Pytest options"""
     parser.addoption("--lab_config", action="store", default="lab-config.yml")
+    parser.addoption("--fmg_concurrency", action="store", type=int, default=16)
 
 
 def pytest_configure(config):
@@ -26,18 +36,262 @@ def pytest_configure(config):
         pytest.lab_config = lab_config
 
 
+# fixtures connecting to the lab FMG
+LAB_FIXTURES = {"lab_fmg", "fmg", "fmg_base", "first_device", "async_lab_fmg", "async_fmg", "async_fmg_base"}
+
+
+def pytest_collection_modifyitems(config, items):
+    """Mark tests needing a lab connection, skip them when there is no lab config
+
+    Offline tests can be selected by ``-m "not lab"``.
+    """
+    skip_lab = pytest.mark.skip(reason=f"Lab config {pytest.lab_config_file} does not exist!")
+    for item in items:
+        if LAB_FIXTURES.intersection(getattr(item, "fixturenames", ())):
+            item.add_marker(pytest.mark.lab)
+            if not pytest.lab_config:
+                item.add_marker(skip_lab)
+
+
+def lab_object_name(name: str) -> str:
+    """Name of a lab object unique to the current pytest-xdist worker
+
+    Parallel workers would change the very same FMG objects otherwise.
+    """
+    return f"{name}-{os.getenv('PYTEST_XDIST_WORKER', 'main')}"
+
+
+# expected error messages of the connection tests
+NOT_OPEN_RE = re.compile("Open connection first!")
+LOGIN_FAILED_RE = re.compile("Login failed, wrong credentials!")
+WRONG_CREDS_RE = re.compile("wrong credentials")
+
+# list and item URL of a lab test object
+AddressURL = namedtuple("AddressURL", "list_url item_url")
+
+
+def limit_concurrency(fmg: AsyncFMG, limit: int) -> AsyncFMG:
+    """Bound the number of concurrent API calls of an AsyncFMG instance
+
+    Tests gathering many requests would hit FMG's per-session limits otherwise. Only the transport methods are bounded:
+    the public methods call each other (e.g. locking an ADOM from ``add``), so bounding them could deadlock.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    def bounded(method):
+        @wraps(method)
+        async def bounded_call(*args, **kwargs):
+            async with semaphore:
+                return await method(*args, **kwargs)
+
+        return bounded_call
+
+    for name in ("_post", "_get_token"):
+        setattr(fmg, name, bounded(getattr(fmg, name)))
+    return fmg
+
+
+# credentials accepted and session token issued by the fake FMG of offline tests
+OFFLINE_PASSWORD = "verysecret"  # pragma: allowlist secret
+OFFLINE_TOKEN = "offline-token"
+OFFLINE_CONFIG = {
+    "base_url": "https://somehost",
+    "verify": False,
+    "username": "myuser",
+    "password": OFFLINE_PASSWORD,
+    "adom": "root",
+}
+# objects served by the fake FMG
+OFFLINE_ADDRESS_NAME = "offline-address"
+OFFLINE_ADDRESS_URL = "/pm/config/adom/root/obj/firewall/address"
+OFFLINE_DATA = {
+    "/sys/status": {"Version": "v7.4.0-build2223 230613 (GA)"},
+    OFFLINE_ADDRESS_URL: [
+        {"name": OFFLINE_ADDRESS_NAME, "subnet": ["10.0.0.0", "255.255.255.0"], "allow-routing": "disable"}
+    ],
+}
+OFFLINE_TASK_URL = "/task/task"
+
+
+def offline_error(code: int, message: str) -> tuple:
+    """URL data of the fake FMG replying an error status instead of data"""
+    return {"code": code, "message": message}, None
+
+
+def offline_task(task_id: int, state: str = "done", percent: int = 100) -> dict:
+    """Task data as the fake FMG returns it"""
+    return {"id": task_id, "adom": 0, "end_tm": 0, "flags": 0, "line": None, "percent": percent, "state": state}
+
+
+def offline_polls(*polls) -> Callable:
+    """URL data of the fake FMG which changes by each request, the last data is repeated forever
+
+    Args:
+        *polls: data to return by the consecutive requests
+    """
+    replies = iter(polls)
+    last = None
+
+    def poll(params: dict):
+        nonlocal last
+        last = next(replies, last)
+        return last
+
+    return poll
+
+
+def offline_reply(request: dict, data: dict) -> dict:
+    """JSON-RPC reply of a fake FMG for offline tests
+
+    Like FMG, the fake only accepts logins with ``OFFLINE_PASSWORD`` and answers with "No permission for the
+    resource" to requests without the issued ``OFFLINE_TOKEN`` session.
+
+    Args:
+        request: JSON-RPC request sent by the client
+        data: data to return by URL, URLs missing from it return no data. Callable data is called with the request
+            parameters to get the data, a ``(status, data)`` tuple replies the status instead of OK, see
+            :func:`offline_error`.
+
+    Returns:
+        (dict): JSON-RPC reply with a status for every request parameter
+    """
+    reply = {"id": request.get("id"), "result": []}
+    if request["params"][0].get("url") == "/sys/login/user":
+        if request["params"][0]["data"]["passwd"] != OFFLINE_PASSWORD:
+            status = {"code": -22, "message": "Login fail"}
+        else:
+            status = {"code": 0, "message": "OK"}
+            reply["session"] = OFFLINE_TOKEN
+    elif request.get("session") != OFFLINE_TOKEN:
+        status = {"code": -11, "message": "No permission for the resource"}
+    else:
+        status = {"code": 0, "message": "OK"}
+    for params in request.get("params", [{}]):
+        url = params.get("url")
+        url_data = data.get(url) if status["code"] == 0 else None
+        if callable(url_data):
+            url_data = url_data(params)
+        url_status, url_data = url_data if isinstance(url_data, tuple) else (status, url_data)
+        reply["result"].append({"status": url_status, "url": url, "data": url_data})
+    return reply
+
+
+class OfflineResponse:
+    """Minimal ``requests.Response`` stand-in carrying an :func:`offline_reply`"""
+
+    def __init__(self, reply: dict):
+        self._reply = reply
+        self.content = json.dumps(reply).encode()
+
+    def json(self) -> dict:
+        return self._reply
+
+
+class AsyncOfflineResponse(OfflineResponse):
+    """Minimal ``aiohttp.ClientResponse`` stand-in carrying an :func:`offline_reply`"""
+
+    async def json(self, loads=json.loads) -> dict:
+        return loads(self.content)
+
+
+def offline_post(url_data: dict, sent: list) -> Callable:
+    """``requests.Session.post`` replacement answering like a fake FMG
+
+    Args:
+        url_data: data to return by URL, see :func:`offline_reply`
+        sent: list collecting the JSON-RPC requests sent to the fake FMG
+    """
+
+    def post(session, url, json=None, data=None, **kwargs) -> OfflineResponse:
+        request = json if json is not None else json_loads(data)
+        sent.append(request)
+        return OfflineResponse(offline_reply(request, url_data))
+
+    return post
+
+
+def async_offline_post(url_data: dict, sent: list) -> Callable:
+    """``aiohttp.ClientSession.post`` replacement answering like a fake FMG
+
+    Args:
+        url_data: data to return by URL, see :func:`offline_reply`
+        sent: list collecting the JSON-RPC requests sent to the fake FMG
+    """
+
+    async def post(session, url, json=None, data=None, **kwargs) -> AsyncOfflineResponse:
+        request = json if json is not None else json_loads(data)
+        sent.append(request)
+        return AsyncOfflineResponse(offline_reply(request, url_data))
+
+    return post
+
+
+@pytest.fixture
+def sent() -> list:
+    """JSON-RPC requests sent to the fake FMG"""
+    return []
+
+
 @pytest.fixture
+def offline_data() -> dict:
+    """Data served by the fake FMG, tests may add or change URLs of it"""
+    return dict(OFFLINE_DATA)
+
+
+@pytest.fixture
+def fake_fmg(sent, offline_data):
+    """Answer the requests of all sync connections by the fake FMG serving ``offline_data``"""
+    with patch("requests.Session.post", new=offline_post(offline_data, sent)):
+        yield
+
+
+@pytest.fixture
+def async_fake_fmg(sent, offline_data):
+    """Answer the requests of all async connections by the fake FMG serving ``offline_data``"""
+    with patch("aiohttp.ClientSession.post", new=async_offline_post(offline_data, sent)):
+        yield
+
+
+@pytest.fixture
+def offline_fmg_base(fake_fmg):
+    """FMGBase logged in to the fake FMG"""
+    with FMGBase(**OFFLINE_CONFIG) as conn:
+        yield conn
+
+
+@pytest.fixture
+async def async_offline_fmg_base(async_fake_fmg):
+    """AsyncFMGBase logged in to the fake FMG"""
+    async with AsyncFMGBase(**OFFLINE_CONFIG) as conn:
+        yield conn
+
+
+@pytest.fixture
+def offline_fmg(fake_fmg):
+    """FMG logged in to the fake FMG"""
+    with FMG(**OFFLINE_CONFIG) as conn:
+        yield conn
+
+
+@pytest.fixture
+async def async_offline_fmg(async_fake_fmg):
+    """AsyncFMG logged in to the fake FMG"""
+    async with AsyncFMG(**OFFLINE_CONFIG) as conn:
+        yield conn
+
+
+@pytest.fixture(scope="session")
 def prepare_lab():
-    """Prepare global lab settings"""
+    """Prepare global lab settings, they are set once for the whole test session"""
     # disable SSL warnings for testing
     requests.packages.urllib3.disable_warnings(requests.packages.urllib3.exceptions.InsecureRequestWarning)
 
 
-@pytest.fixture(scope="class")
-def fmg_base(request):
-    # Create FMGBase object
+@pytest.fixture(scope="session")
+def lab_fmg():
+    # Create FMG object, it is logged in once and is the only sync connection writing the lab
     try:
-        fmg = FMGBase(FMGSettings(**pytest.lab_config.get("fmg")))
+        fmg = FMG(FMGSettings(**pytest.lab_config.get("fmg")))
     except AttributeError as err:
         raise FMGConfigurationException("FMG settings are missing") from err
 
@@ -52,44 +306,80 @@ def fmg_base(request):
 
 
 @pytest.fixture(scope="class")
-def fmg(request):
-    # Create FMG object
+def fmg(lab_fmg):
+    """Session-wide FMG connection, its changes are discarded after each test class
+
+    Unlocking the ADOMs drops the uncommitted changes in workspace mode, and lets other connections (e.g. the async
+    one) lock them.
+    """
+    yield lab_fmg
+    if lab_fmg.lock.locked_adoms:
+        lab_fmg.lock.unlock_adoms()
+
+
+@pytest.fixture(scope="class")
+def fmg_base(fmg):
+    """Session-wide connection for FMGBase tests, FMG is an FMGBase so the same login is used"""
+    return fmg
+
+
+@pytest.fixture(scope="session")
+def first_device(lab_fmg) -> Device:
+    """First managed device of the lab ADOM, looked up once per test session"""
+    return lab_fmg.get(Device).first()
+
+
+@pytest.fixture(scope="session")
+async def async_lab_fmg(pytestconfig):
+    """AsyncFMG connection, it is logged in once and is the only async connection writing the lab
+
+    The connection (and its HTTP session) is kept open, so login and TLS handshake happen only once. Tests breaking the
+    token or settings on purpose must use their own connection.
+    """
     try:
-        fmg = FMG(FMGSettings(**pytest.lab_config.get("fmg")))
-    except AttributeError as err:
+        settings = FMGSettings(**pytest.lab_config.get("fmg"))
+    except (AttributeError, TypeError) as err:
         raise FMGConfigurationException("FMG settings are missing") from err
+    # Create AsyncFMG object, concurrent calls are limited by --fmg_concurrency
+    fmg = limit_concurrency(AsyncFMG(settings), pytestconfig.getoption("--fmg_concurrency"))
 
     # Create connection to FMG
-    fmg.open()
+    await fmg.open()
 
     # Give FMG object to test object
     yield fmg
 
     # Logout and close connection to FMG
-    fmg.close(discard_changes=True)
+    await fmg.close(discard_changes=True)
 
 
-class AsyncTestCase:
-    """Base class for async test cases."""
+@pytest.fixture(scope="class")
+async def async_fmg(async_lab_fmg):
+    """Session-wide AsyncFMG connection, its changes are discarded after each test class like by ``fmg``"""
+    yield async_lab_fmg
+    if async_lab_fmg.lock.locked_adoms:
+        await async_lab_fmg.lock.unlock_adoms()
 
-    @pytest.fixture(scope="session")
-    def event_loop(self):
-        """Override default event loop
 
-        This fixture overrides event_loop for the class and allows to run everything in a single loop. We get context
-        manager errors otherwise.
-        """
-        # give some time for previous test to correctly logout and clean up
-        asyncio.sleep(2)
-        loop = asyncio.get_event_loop()
-        yield loop
-        loop.close()
+@pytest.fixture(scope="class")
+def async_fmg_base(async_fmg):
+    """Session-wide connection for AsyncFMGBase tests, AsyncFMG is an AsyncFMGBase so the same login is used"""
+    return async_fmg
+
+
+class AsyncTestCase:
+    """Base class for async test cases.
+
+    All async tests and fixtures run in a single session-wide event loop (see ``asyncio_default_*_loop_scope`` in
+    pyproject.toml), so the shared connections can be used by every test.
+    """
 
     @pytest.fixture(autouse=True, scope="class")
-    async def fmg_base(self):
-        """Create and use a single FMG instance during all class tests.
+    @classmethod
+    def fmg_base(cls, async_fmg_base):
+        """Give the session-wide async connection to the AsyncFMGBase tests.
 
-        In order to use this fixture, you need to inherit this class and specify ``fmg`` as argument for each test
+        In order to use this fixture, you need to inherit this class and specify ``fmg_base`` as argument for each test
         method.
 
         Examples:
@@ -98,24 +388,12 @@ class AsyncTestCase:
                     assert fmg_base.adom
                     ...
         """
-        # Create AsyncFMG object
-        try:
-            fmg_base = AsyncFMGBase(FMGSettings(**pytest.lab_config.get("fmg")))
-        except AttributeError as err:
-            raise FMGConfigurationException("FMG settings are missing") from err
-
-        # Create connection to FMG
-        await fmg_base.open()
-
-        # Give FMG object to test object
-        yield fmg_base
-
-        # Logout and close connection to FMG
-        await fmg_base.close(discard_changes=True)
+        return async_fmg_base
 
     @pytest.fixture(autouse=True, scope="class")
-    async def fmg(self):
-        """Create and use a single FMG instance during all class tests.
+    @classmethod
+    def fmg(cls, async_fmg):
+        """Give the session-wide AsyncFMG instance to the tests.
 
         In order to use this fixture, you need to inherit this class and specify ``fmg`` as argument for each test
         method.
@@ -126,17 +404,4 @@ class AsyncTestCase:
                     assert fmg.adom
                     ...
         """
-        # Create AsyncFMG object
-        try:
-            fmg = AsyncFMG(FMGSettings(**pytest.lab_config.get("fmg")))
-        except AttributeError as err:
-            raise FMGConfigurationException("FMG settings are missing") from err
-
-        # Create connection to FMG
-        await fmg.open()
-
-        # Give FMG object to test object
-        yield fmg
-
-        # Logout and close connection to FMG
-        await fmg.close(discard_changes=True)
+        return async_fmg
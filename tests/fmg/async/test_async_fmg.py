@@ -2,12 +2,24 @@
 
 import asyncio
 
+import pytest
+
 from pyfortinet import AsyncFMG
+from pyfortinet.exceptions import FMGUnhandledException
 from pyfortinet.fmg_api.common import F
 from pyfortinet.fmg_api.dvmdb import Device
 from pyfortinet.fmg_api.dvmcmd import ModelDevice, DeviceTask
 from pyfortinet.fmg_api.firewall import Address
-from tests.conftest import AsyncTestCase
+from tests.conftest import (
+    OFFLINE_TASK_URL,
+    AsyncTestCase,
+    lab_object_name,
+    offline_error,
+    offline_polls,
+    offline_task,
+)
+
+ADDRESS_NAME = lab_object_name("test-firewall-address")
 
 
 class TestObjectsOnLab(AsyncTestCase):
@@ -16,6 +28,16 @@ class TestObjectsOnLab(AsyncTestCase):
         """Async test callback"""
         await asyncio.sleep(0.1)
 
+    async def test_get_adom_list(self, fmg: AsyncFMG):
+        # lookups are independent, so they are sent concurrently
+        results = await asyncio.gather(
+            fmg.get_adom_list(F(name__like="root")),
+            fmg.get_adom_list(F(name__like="root") | F(name__like="rootp")),
+            fmg.get_adom_list(F(name__like="root") | (F(name__like="rootp") | F(name="others"))),
+            fmg.get_adom_list(F(name__like="root") + (F(name__like="rootp") + F(name="others"))),
+        )
+        assert results == [["root"], ["root", "rootp"], ["others", "root", "rootp"], ["others", "root", "rootp"]]
+
     async def test_dvmdb_device(self, fmg: AsyncFMG):
         device = fmg.get_obj(ModelDevice, name="TEST-DEVICE", sn="FG100FTK22345678", os_ver="7.0", mr=2)
         job = DeviceTask(adom=fmg.adom, device=device)
@@ -29,13 +51,13 @@ class TestObjectsOnLab(AsyncTestCase):
         assert result
 
     async def test_object_functions(self, fmg: AsyncFMG):
-        to_add = fmg.get_obj(Address, name="test-firewall-address", subnet="10.0.0.0/24")
+        to_add = fmg.get_obj(Address, name=ADDRESS_NAME, subnet="10.0.0.0/24")
         # test ADD
         result = await to_add.add()
         assert result
         # test GET
-        address = (await fmg.get(Address, F(name__like="test-firewall-addr%"))).first()
-        assert address.name == "test-firewall-address"
+        address = (await fmg.get(Address, F(name__like=lab_object_name("test-firewall-addr%")))).first()
+        assert address.name == ADDRESS_NAME
         address.subnet = "10.0.1.0/24"
         # test UPDATE
         result = await address.update()
@@ -45,12 +67,68 @@ class TestObjectsOnLab(AsyncTestCase):
         # test DELETE
         result = await address.delete()
         assert result
-        result = await fmg.get(Address, F(name="test-firewall-address"))
+        result = await fmg.get(Address, F(name=ADDRESS_NAME))
         assert result and not result.data  # ensure empty result
         # test SET
         result = await to_add.set()
         assert result
         result = await to_add.delete()
         assert result
-        result = await fmg.get(Address, F(name="test-firewall-address"))
+        result = await fmg.get(Address, F(name=ADDRESS_NAME))
         assert result and not result.data  # ensure empty result
+
+
+class TestTasksOffline:
+    """Task polling against a fake FMG"""
+
+    async def test_wait_for_tasks_done(self, async_offline_fmg, offline_data, sent):
+        offline_data[OFFLINE_TASK_URL] = [offline_task(1), offline_task(2, state="error")]
+        assert await async_offline_fmg.wait_for_tasks(1, 2) == {1: "done", 2: "error"}
+        assert sent[-1]["params"][0]["filter"] == ["id", "in", 1, 2]
+
+    async def test_wait_for_tasks_running(self, async_offline_fmg, offline_data, sent):
+        offline_data[OFFLINE_TASK_URL] = offline_polls(
+            [offline_task(1), offline_task(2, state="running", percent=50)],
+            [offline_task(2)],
+        )
+        progress = []
+
+        async def callback(task_id: int, percent: int, log: str):
+            progress.append((task_id, percent))
+
+        states = await async_offline_fmg.wait_for_tasks(1, 2, callback=callback, loop_interval=0.01)
+        assert states == {1: "done", 2: "done"}
+        assert progress == [(1, 100), (2, 50), (2, 100)]
+        # finished task is not polled anymore
+        assert sent[-1]["params"][0]["filter"] == ["id", "in", 2]
+
+    async def test_wait_for_tasks_not_found(self, async_offline_fmg, offline_data):
+        offline_data[OFFLINE_TASK_URL] = [offline_task(1)]
+        assert await async_offline_fmg.wait_for_tasks(1, 2) == {1: "done", 2: None}
+
+    async def test_wait_for_tasks_error(self, async_offline_fmg, offline_data):
+        offline_data[OFFLINE_TASK_URL] = offline_error(-1, "Internal error")
+        with pytest.raises(FMGUnhandledException):
+            await async_offline_fmg.wait_for_tasks(1, 2)
+
+    async def test_wait_for_tasks_error_retried(self, async_offline_fmg, offline_data):
+        offline_data[OFFLINE_TASK_URL] = offline_polls(offline_error(-1, "Internal error"), [offline_task(1)])
+        # without raising, a failed poll does not stop waiting for the tasks
+        async_offline_fmg.raise_on_error = False
+        assert await async_offline_fmg.wait_for_tasks(1, loop_interval=0.01) == {1: "done"}
+
+    async def test_wait_for_tasks_error_timeout(self, async_offline_fmg, offline_data):
+        offline_data[OFFLINE_TASK_URL] = offline_error(-1, "Internal error")
+        async_offline_fmg.raise_on_error = False
+        with pytest.raises(TimeoutError, match=r"tasks \[1\]"):
+            await async_offline_fmg.wait_for_tasks(1, timeout=0.05, loop_interval=0.01)
+
+    async def test_wait_for_tasks_timeout(self, async_offline_fmg, offline_data):
+        offline_data[OFFLINE_TASK_URL] = [offline_task(1, state="running", percent=10)]
+        with pytest.raises(TimeoutError, match=r"tasks \[1\]"):
+            await async_offline_fmg.wait_for_tasks(1, timeout=0.05, loop_interval=0.01)
+
+    async def test_wait_for_tasks_done_at_timeout(self, async_offline_fmg, offline_data):
+        offline_data[OFFLINE_TASK_URL] = [offline_task(1)]
+        # task finished by the last poll is not reported as timed out
+        assert await async_offline_fmg.wait_for_tasks(1, timeout=0) == {1: "done"}
@@ -1,62 +1,71 @@
 """Test of human API"""
 
 import pytest
+
 from pyfortinet.fmg_api.common import F
 from pyfortinet.fmg_api.dvmdb import Device
 from pyfortinet.fmg_api.firewall import Address
+from tests.conftest import OFFLINE_ADDRESS_NAME, OFFLINE_ADDRESS_URL, OFFLINE_TOKEN, lab_object_name
+
+ADDRESS_NAME = lab_object_name("test-firewall-address")
+WILDCARD_NAME = lab_object_name("test-wildcard")
+SERVER_NAME = lab_object_name("test-server")
+# filters are not changed by the requests, so they are built once
+ADDRESS_FILTER = F(name=ADDRESS_NAME)
+ADDRESS_LIKE_FILTER = F(name__like=lab_object_name("test-firewall-addr%"))
+SERVER_FILTER = F(name=SERVER_NAME)
+OFFLINE_ADDRESS_FILTER = F(name=OFFLINE_ADDRESS_NAME)
 
 
 @pytest.mark.usefixtures("fmg")
 class TestObjectsOnLab:
     def test_firewall_address(self, fmg):
-        to_add = fmg.get_obj(Address(name="test-firewall-address", subnet="10.0.0.0/24", allow_routing="disable"))
+        to_add = fmg.get_obj(Address(name=ADDRESS_NAME, subnet="10.0.0.0/24", allow_routing="disable"))
         # test ADD
         result = to_add.add()
         assert result
         # wildcard test
-        wildcard = fmg.get_obj(Address(name="test-wildcard", type="wildcard", wildcard="10.0.0.1 255.255.0.255"))
+        wildcard = fmg.get_obj(Address(name=WILDCARD_NAME, type="wildcard", wildcard="10.0.0.1 255.255.0.255"))
         result = wildcard.add()
         assert result
-        wildcard = fmg.get(Address, F(name="test-wildcard")).first()
-        assert wildcard
-        wildcard.delete()
+        # the added object already holds the name needed for deletion
+        assert wildcard.delete()
         # test GET
-        address = fmg.get(Address, F(name__like="test-firewall-addr%")).first()
-        assert address.name == "test-firewall-address"
+        address = fmg.get(Address, ADDRESS_LIKE_FILTER).first()
+        assert address.name == ADDRESS_NAME
         address.subnet = "10.0.1.0/24"
         # test UPDATE
         result = address.update()
         assert result
-        address = fmg.get(Address, F(name=address.name)).first()
+        address = fmg.get(Address, ADDRESS_FILTER).first()
         assert address.subnet == "10.0.1.0/24"
         # test DELETE
         result = address.delete()
         assert result
-        result = fmg.get(Address, F(name="test-firewall-address"))
+        result = fmg.get(Address, ADDRESS_FILTER)
         assert result and not result.data  # ensure empty result
         # test SET
         result = to_add.set()
         assert result
         result = to_add.delete()
         assert result
-        result = fmg.get(Address, F(name="test-firewall-address"))
+        result = fmg.get(Address, ADDRESS_FILTER)
         assert result and not result.data  # ensure empty result
 
-    def test_firewall_address_mapping(self, fmg):
+    def test_firewall_address_mapping(self, fmg, first_device: Device):
         # create a new object
-        server: Address = fmg.get_obj(Address(name="test-server", subnet="10.0.0.1/32"))
-        # get first device from FMG
-        fw: Device = fmg.get(Device).first()
+        server: Address = fmg.get_obj(Address(name=SERVER_NAME, subnet="10.0.0.1/32"))
         # create server object in FMG
         server.add()
-        # create a mapping to server object with the fw device and different IP
-        # server.dynamic_mapping = [Address(mapping__scope=[{"name": fw.name, "vdom": "root"}], subnet="2.2.2.2")]
-        server.dynamic_mapping = [Address(mapping__scope=fw.get_vdom_scope("root"), subnet="2.2.2.2")]
+        # create a mapping to server object with the first device and different IP
+        # scope = [{"name": first_device.name, "vdom": "root"}]
+        # server.dynamic_mapping = [Address(mapping__scope=scope, subnet="2.2.2.2")]
+        server.dynamic_mapping = [Address(mapping__scope=first_device.get_vdom_scope("root"), subnet="2.2.2.2")]
         # update server object in FMG
         result = server.update()
         assert result
         # re-load server object from FMG
-        server: Address = fmg.get(Address, F(name="test-server")).first()
+        server: Address = fmg.get(Address, SERVER_FILTER).first()
         # check if we have our mapping
         assert any(address.subnet == "2.2.2.2/32" for address in server.dynamic_mapping)
         #
@@ -76,3 +85,39 @@ class TestObjectsOnLab:
         # assert any(address.subnet == "2.2.2.2/32" for address in server.dynamic_mapping)
         # # check if we really deleted the second mapping
         # assert not any(address.subnet == "3.3.3.3/32" for address in server.dynamic_mapping)
+
+
+class TestObjectsOffline:
+    """Address object handling against a fake FMG, it checks the (de)serialization of objects without a lab"""
+
+    def test_firewall_address_get(self, offline_fmg, sent):
+        address = offline_fmg.get(Address, OFFLINE_ADDRESS_FILTER).first()
+        assert address.name == OFFLINE_ADDRESS_NAME and address.subnet == "10.0.0.0/24"
+        assert sent[-1]["params"][0] == {
+            "url": OFFLINE_ADDRESS_URL,
+            "loadsub": 1,
+            "filter": ["name", "==", OFFLINE_ADDRESS_NAME],
+        }
+
+    def test_firewall_address_add(self, offline_fmg, sent):
+        to_add = offline_fmg.get_obj(Address(name=OFFLINE_ADDRESS_NAME, subnet="10.0.0.0/24", allow_routing="disable"))
+        assert to_add.add()
+        assert sent[-1]["method"] == "add"
+        assert sent[-1]["params"][0]["data"] == {
+            "name": OFFLINE_ADDRESS_NAME,
+            "allow-routing": "disable",
+            "subnet": "10.0.0.0/24",
+        }
+
+    def test_firewall_address_update_and_delete(self, offline_fmg, sent):
+        address = offline_fmg.get(Address, OFFLINE_ADDRESS_FILTER).first()
+        address.subnet = "10.0.1.0/24"
+        assert address.update()
+        assert sent[-1]["method"] == "update" and sent[-1]["params"][0]["data"]["subnet"] == "10.0.1.0/24"
+        assert address.delete()
+        assert sent[-1] == {
+            "method": "delete",
+            "params": [{"url": f"{OFFLINE_ADDRESS_URL}/{OFFLINE_ADDRESS_NAME}"}],
+            "session": OFFLINE_TOKEN,
+            "id": sent[-1]["id"],
+        }
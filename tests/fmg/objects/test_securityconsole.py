@@ -10,16 +10,20 @@ from pyfortinet.fmg_api.common import Scope
 from pyfortinet.fmg_api.dvmdb import Device
 from pyfortinet.fmg_api.securityconsole import InstallDeviceTask
 
+TEST_MARK_RE = re.compile(r"test: \d+")
+
 
 @pytest.mark.usefixtures("fmg")
 class TestObjectsOnLab:
-    def test_install_device(self, fmg):
-        test_device: Device = fmg.get(Device).first()
-        test_device.desc = (
-            test_device.desc + "test: " + str(random.randint(1, 1000))
-            if "test:" not in test_device.desc
-            else re.sub(r"test: \d+", "test: " + str(random.randint(1, 1000)), test_device.desc)
+    def test_install_device(self, fmg, first_device: Device):
+        test_mark = f"test: {random.randint(1, 1000)}"
+        desc = (
+            first_device.desc + test_mark
+            if "test:" not in first_device.desc
+            else TEST_MARK_RE.sub(test_mark, first_device.desc)
         )
+        # work on a copy, the session-wide device must not change
+        test_device: Device = first_device.model_copy(update={"desc": desc})
         test_device.update()
 
         vdom = test_device.vdom[0].name
@@ -3,65 +3,76 @@
 import pytest
 
 from pyfortinet import FMGResponse, AsyncFMGResponse
-from pyfortinet.fmg_api.common import F, text_to_filter
+from pyfortinet.fmg_api.common import F, alias_field, text_to_filter
+from pyfortinet.fmg_api.firewall import Address
 
 
 class TestFilters:
-    def test_simple_filter(self):
-        f = F(name="test_address").generate()
-        assert f == ["name", "==", "test_address"]
-
-    def test_negate_filter(self):
-        f = (~F(name="test_address")).generate()
-        assert f == ["!", "name", "==", "test_address"]
-
-    def test_filter_with_more_values(self):
-        f = F(member__in=["abc", "def", "ghi"]).generate()
-        assert f == ["member", "in", "abc", "def", "ghi"]
-
-    def test_filter_with_implicit_or(self):
-        f = (F(name="test_address") + F(name="test2_address")).generate()
-        assert f == [["name", "==", "test_address"], ["name", "==", "test2_address"]]
-
-    def test_explicit_or_filters(self):
-        f = (F(name="test_address") | F(name="prod_address")).generate()
-        assert f == [["name", "==", "test_address"], "||", ["name", "==", "prod_address"]]
-
-    def test_multiple_filters(self):
-        f = (F(name="acceptance_address") | F(name="test_address") | F(name="prod_address")).generate()
-        assert f == [
-            [["name", "==", "acceptance_address"], "||", ["name", "==", "test_address"]],
-            "||",
-            ["name", "==", "prod_address"],
-        ]
-
-    def test_filters_with_parentheses(self):
-        f = (F(name="acceptance_address") | (F(name="test_address") | F(name="prod_address"))).generate()
-        assert f == [
-            ["name", "==", "acceptance_address"],
-            "||",
-            [["name", "==", "test_address"], "||", ["name", "==", "prod_address"]],
-        ]
-
-    def test_filters_with_parentheses2(self):
-        f = ((F(name="acceptance_address") | F(name="test_address")) & F(state=1)).generate()
-        assert f == [
-            [["name", "==", "acceptance_address"], "||", ["name", "==", "test_address"]],
-            "&&",
-            ["state", "==", 1],
-        ]
-
-    def test_and_filters(self):
-        f = (F(name__like="test%") & F(interface="port1")).generate()
-        assert f == [["name", "like", "test%"], "&&", ["interface", "==", "port1"]]
-
-    def test_complex_filter(self):
-        f = ((F(name="root") + F(name="rootp")) & (F(status=1) + F(status=2))).generate()
-        assert f == [
-            [["name", "==", "root"], ["name", "==", "rootp"]],
-            "&&",
-            [["status", "==", 1], ["status", "==", 2]],
-        ]
+    @pytest.mark.parametrize(
+        "build, expected",
+        [
+            pytest.param(lambda: F(name="test_address"), ["name", "==", "test_address"], id="simple"),
+            pytest.param(lambda: ~F(name="test_address"), ["!", "name", "==", "test_address"], id="negate"),
+            pytest.param(
+                lambda: F(member__in=["abc", "def", "ghi"]),
+                ["member", "in", "abc", "def", "ghi"],
+                id="more_values",
+            ),
+            pytest.param(
+                lambda: F(name="test_address") + F(name="test2_address"),
+                [["name", "==", "test_address"], ["name", "==", "test2_address"]],
+                id="implicit_or",
+            ),
+            pytest.param(
+                lambda: F(name="test_address") | F(name="prod_address"),
+                [["name", "==", "test_address"], "||", ["name", "==", "prod_address"]],
+                id="explicit_or",
+            ),
+            pytest.param(
+                lambda: F(name="acceptance_address") | F(name="test_address") | F(name="prod_address"),
+                [
+                    [["name", "==", "acceptance_address"], "||", ["name", "==", "test_address"]],
+                    "||",
+                    ["name", "==", "prod_address"],
+                ],
+                id="multiple",
+            ),
+            pytest.param(
+                lambda: F(name="acceptance_address") | (F(name="test_address") | F(name="prod_address")),
+                [
+                    ["name", "==", "acceptance_address"],
+                    "||",
+                    [["name", "==", "test_address"], "||", ["name", "==", "prod_address"]],
+                ],
+                id="parentheses",
+            ),
+            pytest.param(
+                lambda: (F(name="acceptance_address") | F(name="test_address")) & F(state=1),
+                [
+                    [["name", "==", "acceptance_address"], "||", ["name", "==", "test_address"]],
+                    "&&",
+                    ["state", "==", 1],
+                ],
+                id="parentheses2",
+            ),
+            pytest.param(
+                lambda: F(name__like="test%") & F(interface="port1"),
+                [["name", "like", "test%"], "&&", ["interface", "==", "port1"]],
+                id="and",
+            ),
+            pytest.param(
+                lambda: (F(name="root") + F(name="rootp")) & (F(status=1) + F(status=2)),
+                [
+                    [["name", "==", "root"], ["name", "==", "rootp"]],
+                    "&&",
+                    [["status", "==", 1], ["status", "==", 2]],
+                ],
+                id="complex",
+            ),
+        ],
+    )
+    def test_filter_generation(self, build, expected):
+        assert build().generate() == expected
 
     def test_first_good(self):
         response = FMGResponse(data={"data": ["response1", "response2"]})
@@ -79,6 +90,12 @@ class TestFilters:
         response = AsyncFMGResponse()
         assert response.first() is None
 
+    @pytest.mark.parametrize("response_class", [FMGResponse, AsyncFMGResponse])
+    def test_first_other_data(self, response_class):
+        assert response_class(data={"data": {"name": "single"}}).first() == {"name": "single"}
+        assert response_class(data=["object1", "object2"]).first() == "object1"
+        assert response_class(data=[]).first() is None
+
     def test_text_to_filter(self):
         assert text_to_filter("name like test%").generate() == ["name", "like", "test%"]
         assert text_to_filter("~name like host_%").generate() == ["!", "name", "like", "host_%"]
@@ -87,3 +104,15 @@ class TestFilters:
             "&&",
             ["conf_status", "==", "insync"],
         ]
+
+
+class TestAliasField:
+    def test_alias_field_accepts_both_forms(self):
+        assert Address(**{"allow-routing": "enable"}).allow_routing == "enable"
+        assert Address(allow_routing="enable").model_dump(by_alias=True, exclude_none=True) == {
+            "allow-routing": "enable"
+        }
+
+    def test_alias_field_shares_alias_choices(self):
+        assert alias_field("obj_id").validation_alias is alias_field("obj_id").validation_alias
+        assert alias_field("meta_fields", sep=" ").serialization_alias == "meta fields"
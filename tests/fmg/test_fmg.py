@@ -1,27 +1,84 @@
 """Test of human API"""
 
 import pytest
+
+from pyfortinet.exceptions import FMGUnhandledException
 from pyfortinet.fmg_api.common import F
+from tests.conftest import OFFLINE_TASK_URL, offline_error, offline_polls, offline_task
+
+# filters are only combined below, never changed in place, so they can be shared by the test cases
+ROOT_FILTER = F(name__like="root")
+ROOTP_FILTER = F(name__like="rootp")
+OTHERS_FILTER = F(name="others")
 
 
 @pytest.mark.usefixtures("fmg")
 class TestObjectsOnLab:
-    def test_get_adom_list(self, fmg):
-        result = fmg.get_adom_list(F(name__like="root"))  # root filter
-        assert result == ["root"]
+    @pytest.mark.parametrize(
+        "adom_filter, expected",
+        [
+            pytest.param(ROOT_FILTER, ["root"], id="single"),
+            pytest.param(ROOT_FILTER | ROOTP_FILTER, ["root", "rootp"], id="or_filters"),
+            pytest.param(ROOT_FILTER | (ROOTP_FILTER | OTHERS_FILTER), ["others", "root", "rootp"], id="three_filters"),
+            pytest.param(ROOT_FILTER + (ROOTP_FILTER + OTHERS_FILTER), ["others", "root", "rootp"], id="filter_list"),
+            pytest.param(
+                ROOT_FILTER + (ROOTP_FILTER + OTHERS_FILTER) & F(state=1),
+                ["others", "root", "rootp"],
+                id="complex_filter",
+            ),
+        ],
+    )
+    def test_get_adom_list(self, fmg, adom_filter, expected):
+        assert fmg.get_adom_list(adom_filter) == expected
+
+
+class TestTasksOffline:
+    """Task polling against a fake FMG"""
+
+    def test_wait_for_tasks_done(self, offline_fmg, offline_data, sent):
+        offline_data[OFFLINE_TASK_URL] = [offline_task(1), offline_task(2, state="error")]
+        assert offline_fmg.wait_for_tasks(1, 2) == {1: "done", 2: "error"}
+        assert sent[-1]["params"][0]["filter"] == ["id", "in", 1, 2]
+
+    def test_wait_for_tasks_running(self, offline_fmg, offline_data, sent):
+        offline_data[OFFLINE_TASK_URL] = offline_polls(
+            [offline_task(1), offline_task(2, state="running", percent=50)],
+            [offline_task(2)],
+        )
+        progress = []
+        states = offline_fmg.wait_for_tasks(1, 2, callback=lambda *args: progress.append(args[:2]), loop_interval=0.01)
+        assert states == {1: "done", 2: "done"}
+        assert progress == [(1, 100), (2, 50), (2, 100)]
+        # finished task is not polled anymore
+        assert sent[-1]["params"][0]["filter"] == ["id", "in", 2]
+
+    def test_wait_for_tasks_not_found(self, offline_fmg, offline_data):
+        offline_data[OFFLINE_TASK_URL] = [offline_task(1)]
+        assert offline_fmg.wait_for_tasks(1, 2) == {1: "done", 2: None}
+
+    def test_wait_for_tasks_error(self, offline_fmg, offline_data):
+        offline_data[OFFLINE_TASK_URL] = offline_error(-1, "Internal error")
+        with pytest.raises(FMGUnhandledException):
+            offline_fmg.wait_for_tasks(1, 2)
 
-    def test_get_adom_list_with_or_filters(self, fmg):
-        result = fmg.get_adom_list(F(name__like="root") | F(name__like="rootp"))
-        assert result == ["root", "rootp"]
+    def test_wait_for_tasks_error_retried(self, offline_fmg, offline_data):
+        offline_data[OFFLINE_TASK_URL] = offline_polls(offline_error(-1, "Internal error"), [offline_task(1)])
+        # without raising, a failed poll does not stop waiting for the tasks
+        offline_fmg.raise_on_error = False
+        assert offline_fmg.wait_for_tasks(1, loop_interval=0.01) == {1: "done"}
 
-    def test_get_adom_list_with_three_filters(self, fmg):
-        result = fmg.get_adom_list(F(name__like="root") | (F(name__like="rootp") | F(name="others")))
-        assert result == ["others", "root", "rootp"]
+    def test_wait_for_tasks_error_timeout(self, offline_fmg, offline_data):
+        offline_data[OFFLINE_TASK_URL] = offline_error(-1, "Internal error")
+        offline_fmg.raise_on_error = False
+        with pytest.raises(TimeoutError, match=r"tasks \[1\]"):
+            offline_fmg.wait_for_tasks(1, timeout=0.05, loop_interval=0.01)
 
-    def test_get_adom_list_with_three_filters2(self, fmg):
-        result = fmg.get_adom_list(F(name__like="root") + (F(name__like="rootp") + F(name="others")))
-        assert result == ["others", "root", "rootp"]
+    def test_wait_for_tasks_timeout(self, offline_fmg, offline_data):
+        offline_data[OFFLINE_TASK_URL] = [offline_task(1, state="running", percent=10)]
+        with pytest.raises(TimeoutError, match=r"tasks \[1\]"):
+            offline_fmg.wait_for_tasks(1, timeout=0.05, loop_interval=0.01)
 
-    def test_get_adom_list_with_complex_filter(self, fmg):
-        result = fmg.get_adom_list((F(name__like="root") + (F(name__like="rootp") + F(name="others")) & F(state=1)))
-        assert result == ["others", "root", "rootp"]
+    def test_wait_for_tasks_done_at_timeout(self, offline_fmg, offline_data):
+        offline_data[OFFLINE_TASK_URL] = [offline_task(1)]
+        # task finished by the last poll is not reported as timed out
+        assert offline_fmg.wait_for_tasks(1, timeout=0) == {1: "done"}
@@ -1,7 +1,5 @@
 """FMGBase tests"""
 
-from copy import deepcopy
-
 import pytest
 from pydantic import SecretStr, ValidationError
 from requests.exceptions import ConnectionError
@@ -9,6 +7,19 @@ from requests.exceptions import ConnectionError
 from pyfortinet import FMGBase
 from pyfortinet import exceptions as fe
 from pyfortinet.settings import FMGSettings
+from tests.conftest import (
+    LOGIN_FAILED_RE,
+    NOT_OPEN_RE,
+    OFFLINE_ADDRESS_NAME,
+    OFFLINE_ADDRESS_URL,
+    OFFLINE_CONFIG,
+    OFFLINE_TOKEN,
+    WRONG_CREDS_RE,
+    AddressURL,
+    lab_object_name,
+)
+
+ADDRESS_NAME = lab_object_name("test-address")
 
 need_lab = pytest.mark.skipif(not pytest.lab_config, reason=f"Lab config {pytest.lab_config_file} does not exist!")
 
@@ -24,116 +35,121 @@ class TestFMGSettings:
         "adom": "root",
     }
 
-    def test_fmg_settings(self):
-        settings = FMGSettings(**self.config)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def settings(cls):
+        """Validated settings shared by the class tests"""
+        return FMGSettings(**cls.config)
+
+    def test_fmg_settings(self, settings):
         assert "jsonrpc" in settings.base_url.path
 
     def test_fmg_settings_bad_url(self):
-        config = deepcopy(self.config)
-        config["base_url"] = "somehost"
+        config = {**self.config, "base_url": "somehost"}
         with pytest.raises(ValidationError, match="Input should be a valid URL"):
             FMGSettings(**config)
 
-    def test_fmg_object_creation_by_object(self):
-        config = deepcopy(self.config)
-        settings = FMGSettings(**config)
-        FMGBase(settings)
-
-    def test_fmg_object_creation_by_kwargs(self):
-        config = deepcopy(self.config)
-        FMGBase(**config)
+    @pytest.mark.parametrize("by_kwargs", [False, True], ids=["by_object", "by_kwargs"])
+    def test_fmg_object_creation(self, settings, by_kwargs):
+        conn = FMGBase(**self.config) if by_kwargs else FMGBase(settings)
+        assert conn.adom == settings.adom
 
-    def test_fmg_need_to_open_first(self):
-        config = deepcopy(self.config)
-        with pytest.raises(fe.FMGTokenException, match="Open connection first!"):
-            settings = FMGSettings(**config)
+    def test_fmg_need_to_open_first(self, settings):
+        with pytest.raises(fe.FMGTokenException, match=NOT_OPEN_RE):
             conn = FMGBase(settings)
             conn.get_version()
 
+    def test_fmg_connection_error(self):
+        # nothing listens on this port, so the connection is refused at once without a lab
+        config = {**self.config, "base_url": "https://127.0.0.1:1", "timeout": 1}
+        conn = FMGBase(FMGSettings(**config))
+        with pytest.raises(ConnectionError):
+            conn.open()
 
+
+@pytest.mark.lab
 @need_lab
 class TestLab:
     """Lab tests"""
 
     config = pytest.lab_config.get("fmg")  # configured in conftest.py
 
+    @pytest.fixture(scope="class")
+    @classmethod
+    def settings(cls):
+        """Validated lab settings shared by the class tests
+
+        Tests which change the settings of their connection must work on a ``model_copy`` of it.
+        """
+        return FMGSettings(**cls.config)
+
     @pytest.mark.dependency()
-    def test_fmg_lab_connect(self, prepare_lab):
-        settings = FMGSettings(**self.config)
+    def test_fmg_lab_connect(self, prepare_lab, settings):
         with FMGBase(settings) as conn:
             ver = conn.get_version()
         assert "-build" in ver
 
-    def test_fmg_lab_connect_wrong_creds(self, prepare_lab):
-        config = deepcopy(self.config)
-        config["password"] = "badpassword"  # pragma: allowlist secret
-        settings = FMGSettings(**config)
-        conn = FMGBase(settings)
-        with pytest.raises(fe.FMGTokenException, match="Login failed, wrong credentials!"):
+    def test_fmg_lab_connect_wrong_creds(self, prepare_lab, settings):
+        bad_settings = settings.model_copy(update={"password": SecretStr("badpassword")})  # pragma: allowlist secret
+        conn = FMGBase(bad_settings)
+        with pytest.raises(fe.FMGTokenException, match=LOGIN_FAILED_RE):
             conn.open()
 
     @pytest.mark.dependency(depends=["TestLab::test_fmg_lab_connect"])
-    def test_fmg_lab_connection_error(self):
-        config = deepcopy(self.config)
-        config["base_url"] = "https://127.0.0.1"
-        settings = FMGSettings(**config)
-        conn = FMGBase(settings)
-        with pytest.raises(ConnectionError):
-            conn.open()
-
-    @pytest.mark.dependency(depends=["TestLab::test_fmg_lab_connect"])
-    def test_fmg_lab_expired_session(self, prepare_lab):
-        settings = FMGSettings(**self.config)
+    def test_fmg_lab_expired_session(self, prepare_lab, settings):
         with FMGBase(settings) as conn:
             conn._token = SecretStr("bad_token")
             conn.get_version()
 
     @pytest.mark.dependency(depends=["TestLab::test_fmg_lab_connect"])
-    def test_fmg_lab_expired_session_and_wrong_creds(self, prepare_lab):
+    def test_fmg_lab_expired_session_and_wrong_creds(self, prepare_lab, settings):
         """Simulate expired token and changed credentials"""
-        settings = FMGSettings(**self.config)
-        with FMGBase(settings) as conn:
+        with FMGBase(settings.model_copy()) as conn:
             conn._token = SecretStr("bad_token")
             conn._settings.password = SecretStr("bad_password")
-            with pytest.raises(fe.FMGTokenException, match="wrong credentials"):
+            with pytest.raises(fe.FMGTokenException, match=WRONG_CREDS_RE):
                 conn.get_version()
 
     @pytest.mark.dependency(depends=["TestLab::test_fmg_lab_connect"])
-    def test_fmg_lab_fail_logout_with_expired_token(self, prepare_lab, caplog):
+    def test_fmg_lab_fail_logout_with_expired_token(self, prepare_lab, caplog, settings):
         """Simulate expired token by logout"""
-        settings = FMGSettings(**self.config)
         with FMGBase(settings) as conn:
             conn._token = SecretStr("bad_token")
-        assert "Logout failed" in caplog.text
+        assert any(message.startswith("Logout failed") for _, _, message in caplog.record_tuples)
 
     @pytest.mark.dependency(depends=["TestLab::test_fmg_lab_connect"])
-    def test_fmg_lab_fail_logout_with_disconnect(self, prepare_lab, caplog):
+    def test_fmg_lab_fail_logout_with_disconnect(self, prepare_lab, caplog, settings):
         """Simulate disconnection by logout"""
-        settings = FMGSettings(**self.config)
-        with FMGBase(settings) as conn:
+        with FMGBase(settings.model_copy()) as conn:
             conn._settings.base_url = "https://127.0.0.1/jsonrpc"
 
-        assert "Logout failed" in caplog.text
+        assert any(message.startswith("Logout failed") for _, _, message in caplog.record_tuples)
 
 
 @pytest.mark.usefixtures("fmg_base")
 class TestObjectsOnLab:
-    def test_address_add_dict(self, fmg_base):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def address_url(cls, fmg_base) -> AddressURL:
+        """URLs of the test address, computed once as the ADOM does not change during the tests"""
         scope = "global" if fmg_base.adom == "global" else f"adom/{fmg_base.adom}"
+        list_url = f"/pm/config/{scope}/obj/firewall/address"
+        return AddressURL(list_url=list_url, item_url=f"{list_url}/{ADDRESS_NAME}")
+
+    def test_address_add_dict(self, fmg_base, address_url):
         address_request = {
-            "url": f"/pm/config/{scope}/obj/firewall/address/test-address",
+            "url": address_url.item_url,
             "data": {
-                "name": "test-address",
+                "name": ADDRESS_NAME,
                 "subnet": "10.0.0.1/32",
             },
         }
         result = fmg_base.add(address_request)
         assert result.success
 
-    def test_address_update_dict(self, fmg_base):
-        scope = "global" if fmg_base.adom == "global" else f"adom/{fmg_base.adom}"
+    def test_address_update_dict(self, fmg_base, address_url):
         address_request = {
-            "url": f"/pm/config/{scope}/obj/firewall/address/test-address",
+            "url": address_url.item_url,
             "data": {
                 "subnet": "10.0.0.2/32",
             },
@@ -141,27 +157,24 @@ class TestObjectsOnLab:
         result = fmg_base.update(address_request)
         assert result.success
 
-    def test_address_get_dict(self, fmg_base):
-        scope = "global" if fmg_base.adom == "global" else f"adom/{fmg_base.adom}"
+    def test_address_get_dict(self, fmg_base, address_url):
         address_request = {
-            "url": f"/pm/config/{scope}/obj/firewall/address",
-            "filter": [["name", "==", "test-address"]],
+            "url": address_url.list_url,
+            "filter": [["name", "==", ADDRESS_NAME]],
         }
         result = fmg_base.get(address_request)
-        assert result.success and result.data["data"][0].get("name") == "test-address"
+        assert result.success and result.first()["name"] == ADDRESS_NAME
 
-    def test_address_del_dict(self, fmg_base):
-        scope = "global" if fmg_base.adom == "global" else f"adom/{fmg_base.adom}"
+    def test_address_del_dict(self, fmg_base, address_url):
         address_request = {
-            "url": f"/pm/config/{scope}/obj/firewall/address/test-address",
+            "url": address_url.item_url,
         }
         result = fmg_base.delete(address_request)
         assert result.success
 
-    def test_address_set_dict(self, fmg_base):
-        scope = "global" if fmg_base.adom == "global" else f"adom/{fmg_base.adom}"
+    def test_address_set_dict(self, fmg_base, address_url):
         address_request = {
-            "url": f"/pm/config/{scope}/obj/firewall/address/test-address",
+            "url": address_url.item_url,
             "data": {
                 "subnet": "10.0.0.2/32",
             },
@@ -169,10 +182,64 @@ class TestObjectsOnLab:
         result = fmg_base.set(address_request)
         assert result.success
 
-    def test_address_cleanup(self, fmg_base):
-        scope = "global" if fmg_base.adom == "global" else f"adom/{fmg_base.adom}"
+    def test_address_cleanup(self, fmg_base, address_url):
         address_request = {
-            "url": f"/pm/config/{scope}/obj/firewall/address/test-address",
+            "url": address_url.item_url,
         }
         result = fmg_base.delete(address_request)
         assert result.success
+
+
+class TestObjectsOffline:
+    """CRUD tests against a fake FMG, they check request/response handling without a lab"""
+
+    item_url = f"{OFFLINE_ADDRESS_URL}/{OFFLINE_ADDRESS_NAME}"
+
+    def test_get_version(self, offline_fmg_base):
+        assert "-build" in offline_fmg_base.get_version()
+
+    def test_address_add_dict(self, offline_fmg_base, sent):
+        address = {"name": OFFLINE_ADDRESS_NAME, "subnet": "10.0.0.1/32"}
+        result = offline_fmg_base.add({"url": OFFLINE_ADDRESS_URL, "data": address})
+        assert result.success
+        assert sent[-1]["method"] == "add" and sent[-1]["session"] == OFFLINE_TOKEN
+
+    def test_address_update_dict(self, offline_fmg_base, sent):
+        result = offline_fmg_base.update({"url": self.item_url, "data": {"subnet": "10.0.0.2/32"}})
+        assert result.success and sent[-1]["method"] == "update"
+
+    def test_address_get_dict(self, offline_fmg_base, sent):
+        result = offline_fmg_base.get({"url": OFFLINE_ADDRESS_URL, "filter": [["name", "==", OFFLINE_ADDRESS_NAME]]})
+        assert result.success and result.first()["name"] == OFFLINE_ADDRESS_NAME
+        assert sent[-1]["params"][0]["filter"] == [["name", "==", OFFLINE_ADDRESS_NAME]]
+
+    def test_address_set_dict(self, offline_fmg_base, sent):
+        result = offline_fmg_base.set({"url": self.item_url, "data": {"subnet": "10.0.0.2/32"}})
+        assert result.success and sent[-1]["method"] == "set"
+
+    def test_address_del_dict(self, offline_fmg_base, sent):
+        result = offline_fmg_base.delete({"url": self.item_url})
+        assert result.success and sent[-1]["method"] == "delete"
+
+    def test_fmg_connect_wrong_creds(self, fake_fmg):
+        conn = FMGBase(**{**OFFLINE_CONFIG, "password": "badpassword"})  # pragma: allowlist secret
+        with pytest.raises(fe.FMGTokenException, match=LOGIN_FAILED_RE):
+            conn.open()
+
+    def test_fmg_expired_session(self, offline_fmg_base, sent):
+        offline_fmg_base._token = SecretStr("bad_token")
+        assert "-build" in offline_fmg_base.get_version()
+        # rejected call is sent again after logging in again
+        urls = [request["params"][0]["url"] for request in sent[-3:]]
+        assert urls == ["/sys/status", "/sys/login/user", "/sys/status"]
+
+    def test_fmg_expired_session_and_wrong_creds(self, offline_fmg_base):
+        offline_fmg_base._token = SecretStr("bad_token")
+        offline_fmg_base._settings.password = SecretStr("bad_password")
+        with pytest.raises(fe.FMGTokenException, match=WRONG_CREDS_RE):
+            offline_fmg_base.get_version()
+
+    def test_fmg_fail_logout_with_expired_token(self, fake_fmg, caplog):
+        with FMGBase(**OFFLINE_CONFIG) as conn:
+            conn._token = SecretStr("bad_token")
+        assert any(message.startswith("Logout failed") for _, _, message in caplog.record_tuples)